@@ -9,16 +9,12 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from Get_Market_Data import get_market_data
-from get_rolling_windows import get_rolling_windows
-from option_contract import european_option
-from blackscholespricer import BS_optionprice
 from blackscholespricer import delta_finder
-from delta_computation import delta_computation
-from hedge_book import hedgebook
-from realised_vol_calculator import realised_volatility_calculation
-from model_error import get_gamma_error
 from mpl_toolkits.mplot3d import Axes3D
 from surface_plotting import surface_plotting
+from bootstrap_bands import bootstrap_surfaces
+from greek_tables import GreekTable
+from simulation_engine import hedging_simulation
 
 # Inputs 
 # ~~~~~
@@ -29,7 +25,8 @@ simulation_params = {
     "Rolling Window": 20,
     "Risk Aversion Coeff.": 1.645,
     "Estimated Volatility": 0.2,
-    "Risk-Free Interest Rate": 0.05
+    "Risk-Free Interest Rate": 0.05,
+    "Greek Table Tolerance": None  # Max. Abs. Error of Interpolated Delta & Gamma (None: Exact)
     }
 
 contract_params = {
@@ -50,77 +47,17 @@ market_data = get_market_data(simulation_params, contract_params)
 
 # 2. Core Simulation Engine
 
-PnL_records = []                                        
-
-for ticker in contract_params["Asset"]:
-    ticker_data = market_data[f"{ticker}"]
-    print(ticker)
-    for maturity in contract_params["Time To Maturity (Years) Range"]:
-        print(maturity)
-        windows = get_rolling_windows(ticker_data, maturity, simulation_params["Rolling Window"])    
-        for money in contract_params["Moneyness Range"]:
-            for roll in windows:
-                data = windows[roll]
-                
-                maturity_d = maturity * 365
-                
-                # Trading Days -> Years
-                
-                # Historical Asset Prices & Contract Strike Price
-
-                S = data["Close/Last"]
-                K = data["Close/Last"].iloc[0] / money
-                
-                # Option Contract & Payoff
-                
-                contract = european_option(S.iloc[0], K, maturity, contract_params["Option Type"])
-                payoff = contract.payoff(S.iloc[-1])
-                
-                # Option Valuation w/ Black-Scholes
-                
-                option_price = BS_optionprice(S.iloc[0], K, simulation_params["Risk-Free Interest Rate"], maturity, simulation_params["Estimated Volatility"], contract_params["Option Type"])
-                delta = delta_computation(data, K, simulation_params["Risk-Free Interest Rate"], simulation_params["Estimated Volatility"], contract_params["Option Type"])     
-     
-                # Hedging Costs
-
-                hedge_cost, money_held = hedgebook(delta, S)
-                
-                # Output 1: Hedge Effectiveness - PnL of Hedging Strategy
-            
-                PnL = option_price - hedge_cost - payoff + money_held[-1]
-                
-                # Output 2 - Diagnostics
-                
-                # Diagnostic 1 - Volatility Mis-Pricing
-                
-                real_vol = realised_volatility_calculation(data)
-                option_price_real = BS_optionprice(S.iloc[0], K, simulation_params["Risk-Free Interest Rate"], maturity, real_vol, contract_params["Option Type"])
-                vol_mispricing = option_price_real - option_price
-                
-                # Diagnostic 2 - Gamma Error
-                
-                gamma_error = get_gamma_error(data, K, simulation_params["Risk-Free Interest Rate"], simulation_params["Estimated Volatility"], contract_params["Option Type"])
-            
-                # Append
-                
-                PnL_records.append({
-                    "Ticker": ticker,
-                    "Maturity (days)": maturity_d,
-                    "Moneyness": money,
-                    "Start Date": roll,
-                    "Option Price": option_price,
-                    "PnL": PnL,
-                    "Realised Volatility": real_vol,
-                    "Volatility Mispricing": vol_mispricing,
-                    "Gamma Error": gamma_error
-                    })
+greek_table = None
+if simulation_params["Greek Table Tolerance"] is not None:
+    greek_table = GreekTable(simulation_params["Greek Table Tolerance"])
+
+PnL_dataframe = hedging_simulation(market_data, simulation_params, contract_params, greek_table, verbose=True)
+
 # ~~~~~
 
 # Data Post-Processing
 # ~~~~~
 
-PnL_dataframe = pd.DataFrame(PnL_records)  # List of Dictionaries to DataFrame
-
 # Extraction of Plotting Parameters
 
 T_days = contract_params["Time To Maturity (Years) Range"] * 365
@@ -213,6 +150,21 @@ surface_plotting(
     cmap='inferno'
 )
 
+# Plot 4 - Width of 95% Block-Bootstrap Confidence Band on Mean PnL
+bands = bootstrap_surfaces(PnL_dataframe, simulation_params, B=1000, seed=0)
+mean_PnL_band = bands["Mean PnL"]
+mean_PnL_band["95% CI Width"] = mean_PnL_band["Mean PnL Upper"] - mean_PnL_band["Mean PnL Lower"]
+
+surface_plotting(
+    mean_PnL_band,
+    x_col="Moneyness",
+    y_col="Maturity (days)",
+    z_col="95% CI Width",
+    title="3D Surface: 95% CI Width of Mean PnL (Block Bootstrap)",
+    z_label="95% CI Width",
+    cmap='viridis'
+)
+
 # Plot - Volatility Mispricing (Mean)
 mean_vol_misprice = PnL_dataframe.groupby(["Maturity (days)", "Moneyness"])["Volatility Mispricing"].mean().reset_index(name="Mean Volatility Mis-Pricing")
 std_vol_misprice = PnL_dataframe.groupby(["Maturity (days)", "Moneyness"])["Volatility Mispricing"].std().reset_index(name="Std. Dev of Volatility Mis-Pricing")
@@ -0,0 +1,229 @@
+import heapq
+import warnings
+import numpy as np
+import pandas as pd
+from simulation_engine import hedging_simulation
+
+
+def cell_statistics(market_data, maturity, money, simulation_params, contract_params, window_cache=None):
+    """
+    Mean and standard deviation of the hedging PnL for a single
+    (maturity, moneyness) contract, pooled across all assets.
+
+    Parameters
+    ----------
+    market_data : dict
+        Dictionary of market data DataFrames keyed by ticker (see get_market_data).
+    maturity : float
+        Time to maturity in years.
+    money : float
+        Moneyness (S0 / K).
+    simulation_params : dict
+        Simulation parameters (see Main.py).
+    contract_params : dict
+        Contract parameters ("Asset", "Option Type"; the ranges are replaced
+        by maturity and money).
+    window_cache : dict, optional
+        Cache of rolling windows keyed by (ticker, maturity), shared between
+        calls so that windows are only extracted once per maturity.
+
+    Returns
+    -------
+    mean_PnL : float
+        Mean PnL across all rolling windows.
+    std_PnL : float
+        Sample standard deviation of PnL across all rolling windows.
+    n_windows : int
+        Number of rolling windows used.
+    """
+
+    contract = dict(contract_params, **{
+        "Time To Maturity (Years) Range": [maturity],
+        "Moneyness Range": [money]
+    })
+    PnL = hedging_simulation(market_data, simulation_params, contract, window_cache=window_cache)["PnL"].to_numpy()
+    if len(PnL) < 2:
+        return np.nan, np.nan, len(PnL)
+
+    return PnL.mean(), PnL.std(ddof=1), len(PnL)
+
+
+def adaptive_surface_sweep(market_data, simulation_params, contract_params, tol=0.5, max_points=None, coarse_points=5):
+    """
+    Adaptive sweep of the maturity / moneyness surface.
+
+    Points lie on a lattice: the maturities of contract_params snapped to
+    whole trading days k / 252 and the moneyness levels of contract_params.
+    The window length is int(T * 252), so the surface steps between adjacent
+    trading days and cannot be interpolated in maturity: every lattice
+    maturity is evaluated, and refinement is along moneyness within each
+    maturity row.
+
+    Each row starts from coarse_points moneyness levels. The error estimate
+    of a segment between two evaluated levels is 4 times the largest absolute
+    difference, over the mean and std. deviation of PnL, between the value at
+    its midpoint and the linear interpolation of its ends. The midpoint
+    deviation is the exact interpolation error for a quadratic, and at least
+    half of it for a single step, so the factor 4 covers a step on top of the
+    curvature. The segment with the largest estimate is split at its midpoint
+    until every estimate is below tol. A non-finite estimate (e.g. a NaN
+    statistic) is treated as unresolved and split first.
+
+    If max_points is reached first, the sweep stops and issues a
+    RuntimeWarning with the number of unresolved segments and the largest
+    remaining estimate.
+
+    Parameters
+    ----------
+    market_data : dict
+        Dictionary of market data DataFrames keyed by ticker.
+    simulation_params : dict
+        Simulation parameters (see Main.py).
+    contract_params : dict
+        Contract parameters (see Main.py). "Time To Maturity (Years) Range"
+        and "Moneyness Range" define the lattice (e.g. np.arange(10, 505) / 252
+        for every trading day).
+    tol : float
+        Tolerance (in PnL units) on the interpolation error along moneyness.
+    max_points : int, optional
+        Maximum number of (maturity, moneyness) points evaluated (None: up to
+        the full lattice).
+    coarse_points : int
+        Number of moneyness levels per maturity row in the initial grid.
+
+    Returns
+    -------
+    surface : pd.DataFrame
+        Scattered surface with columns "Maturity (days)", "Moneyness",
+        "Mean PnL", "Std. Deviation of PnL" and "Windows", one row per
+        evaluated point. surface.attrs["Max. Error Estimate"] holds the
+        largest error estimate of the final segments (at most tol unless the
+        point budget was reached). Suitable for surface_plotting with
+        scattered=True and for surface_error.
+    """
+
+    # 1. Lattice: Contract Maturities Snapped to Trading Days x Moneyness Levels
+
+    T_range = np.asarray(contract_params["Time To Maturity (Years) Range"], dtype=float)
+    T_lattice = np.unique((T_range * 252).astype(int)) / 252
+    m_lattice = np.unique(contract_params["Moneyness Range"])
+    m_coarse = np.unique(np.linspace(0, len(m_lattice) - 1, coarse_points).round().astype(int))
+
+    if max_points is None:
+        max_points = len(T_lattice) * len(m_lattice)
+
+    # Coarse Levels plus the Midpoints Needed for their Error Estimates
+
+    coarse_segments = list(zip(m_coarse[:-1], m_coarse[1:]))
+    if len(T_lattice) * (len(m_coarse) + sum(j1 - j0 > 1 for j0, j1 in coarse_segments)) > max_points:
+        raise ValueError("Point budget is smaller than the coarse grid.")
+
+    nodes = {}
+    window_cache = {}
+
+    def evaluate(i, j):
+        if (i, j) not in nodes:
+            nodes[(i, j)] = cell_statistics(market_data, T_lattice[i], m_lattice[j], simulation_params, contract_params, window_cache)
+        return nodes[(i, j)]
+
+    def segment_error(i, j0, j1):
+
+        # Segments One Lattice Step Wide are Exact
+
+        if j1 - j0 <= 1:
+            return 0.0
+
+        jc = (j0 + j1) // 2
+        u = (jc - j0) / (j1 - j0)
+        left, mid, right = evaluate(i, j0), evaluate(i, jc), evaluate(i, j1)
+        err = max(abs(mid[k] - ((1 - u) * left[k] + u * right[k])) for k in range(2))
+        return 4 * err if np.isfinite(err) else np.inf
+
+    def new_points(i, j0, j1):
+        return sum((i, j) not in nodes for j in {j0, (j0 + j1) // 2, j1})
+
+    # 2. Coarse Grid: Every Maturity Row (Priority Queue on Error Estimate)
+
+    heap = []
+    for i in range(len(T_lattice)):
+        for j0, j1 in coarse_segments:
+            heapq.heappush(heap, (-segment_error(i, j0, j1), (i, j0, j1)))
+
+    # 3. Refinement Loop (Segments Skipped for Lack of Budget Stay Unresolved)
+
+    final = []
+    unresolved = []
+    while heap:
+        neg_err, segment = heapq.heappop(heap)
+        if -neg_err <= tol:
+            final.append(-neg_err)
+            final += [-e for e, _ in heap]
+            break
+
+        i, j0, j1 = segment
+        jc = (j0 + j1) // 2
+        split = [(i, j0, jc), (i, jc, j1)]
+        if len(nodes) + sum(new_points(*child) for child in split) > max_points:
+            unresolved.append(-neg_err)
+            continue
+
+        for child in split:
+            heapq.heappush(heap, (-segment_error(*child), child))
+
+    if unresolved:
+        warnings.warn(
+            f"Point budget of {max_points} reached with {len(unresolved)} segments above tol "
+            f"(largest error estimate {max(unresolved):.3g}).", RuntimeWarning, stacklevel=2
+        )
+
+    # 4. Scattered Surface Output
+
+    surface = pd.DataFrame(
+        [(T_lattice[i] * 365, m_lattice[j], *stats) for (i, j), stats in nodes.items()],
+        columns=["Maturity (days)", "Moneyness", "Mean PnL", "Std. Deviation of PnL", "Windows"]
+    )
+    surface = surface.sort_values(["Maturity (days)", "Moneyness"]).reset_index(drop=True)
+    surface.attrs["Max. Error Estimate"] = max(final + unresolved, default=0.0)
+
+    return surface
+
+
+def surface_error(surface, dense_surface, z_col, x_col="Moneyness", y_col="Maturity (days)"):
+    """
+    Maximum absolute difference between a scattered (adaptive) surface,
+    interpolated onto the points of a dense surface, and the dense surface.
+
+    The window length of a maturity T is int(T * 252) trading days, so the
+    surface is step-like in maturity. Dense maturities are therefore matched
+    to the maturity row of the same trading day, and interpolated linearly
+    along x_col within that row.
+
+    Parameters
+    ----------
+    surface : pd.DataFrame
+        Scattered surface (e.g. output of adaptive_surface_sweep).
+    dense_surface : pd.DataFrame
+        Surface evaluated on the full dense grid.
+    z_col : str
+        Column to compare (e.g. "Mean PnL").
+    x_col, y_col : str
+        Coordinate columns (y_col in calendar days, as "Maturity (days)").
+
+    Returns
+    -------
+    float
+        Maximum absolute error over the dense grid points (NaN where the
+        trading day has no row in surface).
+    """
+
+    rows = dict(iter(surface.groupby((surface[y_col] / 365 * 252).round().astype(int))))
+    trading_days = (dense_surface[y_col].to_numpy() / 365 * 252).astype(int)
+
+    Z = np.full(len(dense_surface), np.nan)
+    for day in np.unique(trading_days):
+        if day in rows:
+            row = rows[day]
+            mask = trading_days == day
+            Z[mask] = np.interp(dense_surface[x_col].to_numpy()[mask], row[x_col].to_numpy(), row[z_col].to_numpy())
+
+    return np.nanmax(np.abs(Z - dense_surface[z_col].to_numpy()))
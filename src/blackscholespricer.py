@@ -63,8 +63,8 @@ def delta_finder(S, K, r, tau, vol, option_type):
     ----------
     S : float or array-like
         Current asset price(s).
-    K : float
-        Strike price (must be positive).
+    K : float or array-like
+        Strike price(s) (must be positive).
     r : float
         Risk-free interest rate (annualised).
     tau : float or array-like
@@ -87,7 +87,7 @@ def delta_finder(S, K, r, tau, vol, option_type):
     
     if np.any(S < 0):
         raise ValueError("Asset price must be non-negative.")
-    if K <= 0:
+    if np.any(np.asarray(K) <= 0):
         raise ValueError("Strike price must be positive.")
     if np.any(tau < 0):
         raise ValueError("Time to expiration must be non-negative.")
@@ -120,8 +120,8 @@ def gamma_finder(S, K, r, tau, vol, option_type):
     ----------
     S : float or array-like
         Current asset price(s).
-    K : float
-        Strike price (must be positive).
+    K : float or array-like
+        Strike price(s) (must be positive).
     r : float
         Risk-free interest rate (annualised).
     tau : float or array-like
@@ -144,7 +144,7 @@ def gamma_finder(S, K, r, tau, vol, option_type):
 
     if np.any(S <= 0):
         raise ValueError("Asset price must be strictly positive.")
-    if K <= 0:
+    if np.any(np.asarray(K) <= 0):
         raise ValueError("Strike price must be positive.")
     if np.any(tau < 0):
         raise ValueError("Time to expiration must be non-negative.")
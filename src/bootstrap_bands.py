@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+
+
+def block_bootstrap_indices(n, B, block_length, method="stationary", rng=None):
+    """
+    Block bootstrap resampling of the window indices 0, ..., n - 1.
+
+    Parameters
+    ----------
+    n : int
+        Number of (time-ordered) rolling windows.
+    B : int
+        Number of bootstrap replicates.
+    block_length : int
+        Block length (moving) or mean block length (stationary).
+    method : str
+        "stationary" (Politis-Romano, geometric block lengths, circular) or
+        "moving" (fixed-length overlapping blocks).
+    rng : np.random.Generator, optional
+        Random number generator.
+
+    Returns
+    -------
+    idx : np.ndarray
+        (B x n) matrix of resampled window indices.
+    """
+
+    if rng is None:
+        rng = np.random.default_rng()
+    if method not in ["stationary", "moving"]:
+        raise ValueError("Method must be 'stationary' or 'moving'.")
+
+    L = int(min(max(block_length, 1), n))
+    t = np.arange(n)
+
+    if method == "moving":
+        n_blocks = -(-n // L)
+        starts = rng.integers(0, n - L + 1, size=(B, n_blocks))
+        return (starts[:, :, None] + np.arange(L)).reshape(B, -1)[:, :n]
+
+    # Stationary: New Block Starts with Probability 1 / L, Otherwise Continue Circularly
+
+    restart = rng.random((B, n)) < 1 / L
+    restart[:, 0] = True
+    starts = rng.integers(0, n, size=(B, n))
+    last = np.maximum.accumulate(np.where(restart, t, 0), axis=1)
+    return (np.take_along_axis(starts, last, axis=1) + (t - last)) % n
+
+
+def bootstrap_surfaces(PnL_dataframe, simulation_params, B=1000, block_length=None, method="stationary", alpha=0.05, seed=None):
+    """
+    Block-bootstrap confidence bands for the mean PnL, std. deviation of PnL
+    and volatility premium surfaces.
+
+    Rolling windows of the same maturity overlap heavily, so windows are
+    resampled in blocks of consecutive start dates rather than independently.
+    All assets share the resampled start dates. For each maturity the
+    (B x windows) index matrix is converted to resampling counts and every
+    moneyness cell is reduced at once with matrix products.
+
+    Parameters
+    ----------
+    PnL_dataframe : pd.DataFrame
+        Output of the simulation engine in Main.py. Must contain "Ticker",
+        "Maturity (days)", "Moneyness", "Start Date" and "PnL" columns.
+    simulation_params : dict
+        Simulation parameters. Relevant parameters:
+            - "Rolling Window" (int): Step between window start dates
+            - "Risk Aversion Coeff." (float): Weight on the std. deviation of PnL
+    B : int
+        Number of bootstrap replicates.
+    block_length : int, optional
+        Block length in windows. Defaults to the number of windows a single
+        window overlaps, ceil(maturity in trading days / rolling window).
+    method : str
+        "stationary" or "moving" block bootstrap.
+    alpha : float
+        Significance level; bands are the alpha / 2 and 1 - alpha / 2 quantiles.
+    seed : int, optional
+        Seed for the random number generator.
+
+    Returns
+    -------
+    bands : dict
+        Dictionary of DataFrames keyed by "Mean PnL", "Std. Deviation of PnL"
+        and "Volatility Premium". Each has columns "Maturity (days)",
+        "Moneyness", the point estimate, "<name> Lower" and "<name> Upper".
+    """
+
+    rng = np.random.default_rng(seed)
+    rw = simulation_params["Rolling Window"]
+    ra = simulation_params["Risk Aversion Coeff."]
+    q = [100 * alpha / 2, 100 * (1 - alpha / 2)]
+
+    names = ["Mean PnL", "Std. Deviation of PnL", "Volatility Premium"]
+    records = {name: [] for name in names}
+
+    for maturity_d, group in PnL_dataframe.groupby("Maturity (days)"):
+
+        # 1. PnL Cube: (Start Date x Ticker x Moneyness), NaN where Missing
+
+        cube = group.pivot_table(index="Start Date", columns=["Ticker", "Moneyness"], values="PnL", aggfunc="first")
+        cube = cube.sort_index()
+        tickers = cube.columns.get_level_values(0).unique()
+        money = cube.columns.get_level_values(1).unique().sort_values()
+        cube = cube.reindex(columns=pd.MultiIndex.from_product([tickers, money]))
+
+        n = len(cube)
+        X = cube.to_numpy().reshape(n, len(tickers), len(money))
+        mask = ~np.isnan(X)
+        X = np.where(mask, X, 0.0)
+
+        # Per-Window Sums over Assets (Assets Resampled Together)
+
+        M1 = mask.sum(axis=1)
+        X1 = X.sum(axis=1)
+        X2 = (X**2).sum(axis=1)
+
+        # 2. Resampling Counts from the (B x n) Index Matrix
+
+        L = block_length
+        if L is None:
+            L = np.ceil(int(maturity_d / 365 * 252) / rw)
+        idx = block_bootstrap_indices(n, B, L, method, rng)
+        counts = np.bincount((idx + n * np.arange(B)[:, None]).ravel(), minlength=B * n).reshape(B, n).astype(float)
+
+        # 3. Replicate Statistics for All Moneyness Cells (B x Moneyness)
+
+        N = counts @ M1
+        S1 = counts @ X1
+        S2 = counts @ X2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = S1 / N
+            std = np.sqrt(np.maximum(S2 - S1 * mean, 0.0) / (N - 1))
+        prem = -mean + ra * std
+
+        # 4. Point Estimates & Quantile Bands
+
+        N0, S10, S20 = M1.sum(axis=0), X1.sum(axis=0), X2.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean0 = S10 / N0
+            std0 = np.sqrt(np.maximum(S20 - S10 * mean0, 0.0) / (N0 - 1))
+        point = {"Mean PnL": mean0, "Std. Deviation of PnL": std0, "Volatility Premium": -mean0 + ra * std0}
+
+        for name, reps in zip(names, [mean, std, prem]):
+            lower, upper = np.nanpercentile(reps, q, axis=0)
+            records[name].append(pd.DataFrame({
+                "Maturity (days)": maturity_d,
+                "Moneyness": money.to_numpy(),
+                name: point[name],
+                f"{name} Lower": lower,
+                f"{name} Upper": upper
+            }))
+
+    return {name: pd.concat(records[name], ignore_index=True) for name in names}
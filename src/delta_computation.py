@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 from blackscholespricer import delta_finder
 
-def delta_computation(data, K, r, vol, option_type):
+def delta_computation(data, K, r, vol, option_type, greek_table=None):
     """
     Computes delta for each time step in the data (vectorised).
     
@@ -12,6 +12,8 @@ def delta_computation(data, K, r, vol, option_type):
         r (float): Risk-free rate
         vol (float): Volatility
         option_type (str): 'call' or 'put'
+        greek_table (GreekTable, optional): Interpolated Greek tables; if given,
+            delta is looked up in the tables instead of evaluated exactly
     
     Returns:
         delta (np.ndarray): Array of deltas for each row in data
@@ -21,4 +23,7 @@ def delta_computation(data, K, r, vol, option_type):
     tau_days = (data["Date"].iloc[-1] - data["Date"]).dt.days.to_numpy()
     tau = tau_days / 365
     
+    if greek_table is not None:
+        return greek_table.delta(S, K, r, tau, vol, option_type)
+    
     return delta_finder(S, K, r, tau, vol, option_type)
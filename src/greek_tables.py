@@ -0,0 +1,322 @@
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+from simulation_engine import hedging_simulation
+
+
+class GreekTable:
+    """
+    Precomputed Black-Scholes delta and gamma on a 2-D grid, evaluated by
+    vectorised bilinear interpolation as an approximate alternative to
+    delta_finder and gamma_finder (see validation_report for the trade-off).
+
+    The grid coordinates are the normalised forward log-moneyness
+    x = (log(S/K) + r tau) / (vol sqrt(tau)) and s = vol sqrt(tau), in which
+    d1 = x + s / 2. The tabulated functions are the call delta N(d1) and the
+    normalised gamma n(d1) = S vol sqrt(tau) gamma.
+
+    The grid spacing is chosen from the bilinear interpolation error bound
+    (hx^2 |f_xx| + hs^2 |f_ss|) / 8 so that both tables are within tol of the
+    exact values, and x is clipped to a range beyond which the clipped value
+    is also within tol. The maximum error measured at cell midpoints is
+    stored in max_error.
+
+    Attributes
+    ----------
+    tol : float
+        Guaranteed maximum absolute error of the delta and normalised gamma.
+    s_max : float
+        Largest vol sqrt(tau) covered by the table.
+    x_grid, s_grid : np.ndarray
+        Grid coordinates.
+    table : np.ndarray
+        (len(x_grid) * len(s_grid) x 2) memory-mapped array of interleaved
+        (delta, normalised gamma) pairs, flattened in (x, s) order.
+    max_error : float
+        Largest interpolation error measured at cell midpoints.
+    """
+
+    # Largest |f''| of N(z) and n(z): n(1) and n(0)
+
+    _max_curvature = max(norm.pdf(1.0), norm.pdf(0.0))
+
+    def __init__(self, tol=1e-4, s_max=2.0, cache_dir=None):
+        """
+        Initialises the GreekTable object, loading the tables from the disk
+        cache if present and building them otherwise.
+
+        Parameters
+        ----------
+        tol : float
+            Maximum absolute error of the delta and normalised gamma.
+        s_max : float
+            Largest vol sqrt(tau) to cover (e.g. vol = 1 and tau = 4 years).
+        cache_dir : str, optional
+            Directory of the table cache. Defaults to ~/.cache/delta_hedging.
+        """
+
+        if tol <= 0:
+            raise ValueError("Tolerance must be positive.")
+        if s_max <= 0:
+            raise ValueError("Maximum vol sqrt(tau) must be positive.")
+
+        self.tol = float(tol)
+        self.s_max = float(s_max)
+
+        # 1. Grid from the Error Bound: (hx^2 + hs^2 / 4) |F''| / 8 <= tol with hs = 2 hx
+
+        hx = np.sqrt(4 * tol / self._max_curvature)
+        X = max(norm.isf(tol), np.sqrt(-2 * np.log(tol * np.sqrt(2 * np.pi)))) + s_max / 2
+        nx = int(np.ceil(2 * X / hx)) + 1
+        ns = int(np.ceil(s_max / (2 * hx))) + 1
+        self.x_grid = np.linspace(-X, X, nx)
+        self.s_grid = np.linspace(0, s_max, ns)
+
+        # 2. Disk Cache (Memory-Mapped), Keyed on the Exact Parameters
+
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "delta_hedging")
+        self.path = os.path.join(cache_dir, f"greeks_pairs_tol{self.tol!r}_smax{self.s_max!r}.npy")
+
+        if not os.path.exists(self.path):
+            self._build_cache(cache_dir)
+
+        # A Cache File of the Wrong Shape or Type (e.g. Truncated) is Rebuilt Once
+
+        self.table = self._load_cache()
+        if self.table is None:
+            self._build_cache(cache_dir)
+            self.table = self._load_cache()
+            if self.table is None:
+                raise ValueError(f"Corrupt Greek table cache: {self.path}")
+
+        # Complex View: Each (delta, gamma) Pair is Fetched by a Single Gather
+
+        self._pairs = np.asarray(self.table).view(np.complex128).ravel()
+        self._inv_hx = 1 / (self.x_grid[1] - self.x_grid[0])
+        self._inv_hs = 1 / (self.s_grid[1] - self.s_grid[0])
+
+        # 3. Measured Error at Cell Midpoints (Worst Case for Bilinear)
+
+        x_mid = 0.5 * (self.x_grid[1:] + self.x_grid[:-1])[:, None]
+        s_mid = 0.5 * (self.s_grid[1:] + self.s_grid[:-1])[None, :]
+        d_approx, g_approx = self.lookup(x_mid, s_mid)
+        self.max_error = max(
+            np.abs(d_approx - norm.cdf(x_mid + 0.5 * s_mid)).max(),
+            np.abs(g_approx - norm.pdf(x_mid + 0.5 * s_mid)).max()
+        )
+
+    def _build_cache(self, cache_dir):
+        """
+        Computes the (delta, normalised gamma) pairs and writes them to
+        self.path.
+        """
+
+        os.makedirs(cache_dir, exist_ok=True)
+        d1 = (self.x_grid[:, None] + 0.5 * self.s_grid[None, :]).ravel()
+
+        # Written to a temporary file and moved into place so readers never see a partial file
+
+        f = tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".npy", delete=False)
+        try:
+            with f:
+                np.save(f, np.stack([norm.cdf(d1), norm.pdf(d1)], axis=1))
+            os.replace(f.name, self.path)
+        except BaseException:
+            if os.path.exists(f.name):
+                os.remove(f.name)
+            raise
+
+    def _load_cache(self):
+        """
+        Memory-maps self.path, returning None if it is not a float64 table of
+        the expected shape.
+        """
+
+        try:
+            table = np.load(self.path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        if table.shape != (len(self.x_grid) * len(self.s_grid), 2) or table.dtype != np.float64:
+            return None
+
+        return table
+
+    def lookup(self, x, s):
+        """
+        Bilinear interpolation of the tables.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Normalised forward log-moneyness.
+        s : np.ndarray
+            vol sqrt(tau) (broadcastable with x).
+
+        Returns
+        -------
+        delta : np.ndarray
+            Call delta N(d1).
+        gamma_n : np.ndarray
+            Normalised gamma n(d1).
+        """
+
+        x, s = np.broadcast_arrays(x, s)
+        if np.any((s < 0) | (s > self.s_max)):
+            raise ValueError("vol sqrt(tau) is outside the range of the table.")
+
+        nx, ns = len(self.x_grid), len(self.s_grid)
+
+        # Cell Indices & Fractional Positions (Shared by Delta and Gamma)
+
+        tx = x - self.x_grid[0]
+        tx *= self._inv_hx
+        np.clip(tx, 0, nx - 1, out=tx)
+        ts = s * self._inv_hs
+        ix = np.minimum(tx.astype(np.intp), nx - 2)
+        js = np.minimum(ts.astype(np.intp), ns - 2)
+        tx -= ix
+        ts -= js
+
+        base = ix * ns
+        base += js
+
+        # Bilinear Interpolation of the (delta + i gamma) Pairs
+
+        tx = tx.astype(np.complex128)
+        ts = ts.astype(np.complex128)
+        c00 = self._pairs.take(base)
+        c01 = self._pairs.take(base + 1)
+        base += ns
+        c10 = self._pairs.take(base)
+        c11 = self._pairs.take(base + 1)
+        c01 -= c00
+        c01 *= ts
+        c00 += c01
+        c11 -= c10
+        c11 *= ts
+        c10 += c11
+        c10 -= c00
+        c10 *= tx
+        c00 += c10
+
+        return c00.real, c00.imag
+
+    def delta(self, S, K, r, tau, vol, option_type):
+        """
+        Approximate Black-Scholes delta (same interface as delta_finder).
+        """
+
+        S, expired, x, s = self._coordinates(S, K, r, tau, vol, option_type)
+        delta, _ = self.lookup(x, s)
+
+        if option_type == "call":
+            return np.where(expired, 1.0, delta)
+        else:  # Put
+            return np.where(expired, -1.0, delta - 1.0)
+
+    def gamma(self, S, K, r, tau, vol, option_type):
+        """
+        Approximate Black-Scholes gamma (same interface as gamma_finder).
+        """
+
+        if np.any(np.asarray(S) <= 0):
+            raise ValueError("Asset price must be strictly positive.")
+
+        S, expired, x, s = self._coordinates(S, K, r, tau, vol, option_type)
+        _, gamma_n = self.lookup(x, s)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(expired, 0.0, gamma_n / (S * s))
+
+    def _coordinates(self, S, K, r, tau, vol, option_type):
+        """
+        Input validation (as in delta_finder), expiry mask and table
+        coordinates.
+        """
+
+        S = np.atleast_1d(S).astype(float)
+        tau = np.atleast_1d(tau).astype(float)
+
+        if np.any(S < 0):
+            raise ValueError("Asset price must be non-negative.")
+        if np.any(np.asarray(K) <= 0):
+            raise ValueError("Strike price must be positive.")
+        if np.any(tau < 0):
+            raise ValueError("Time to expiration must be non-negative.")
+        if vol <= 0:
+            raise ValueError("Volatility must be strictly positive.")
+        if option_type not in ["call", "put"]:
+            raise ValueError("Option type must be 'call' or 'put'.")
+
+        # Expiry Mask: np.isclose(tau, 0) for Non-Negative tau; x There is Arbitrary
+
+        expired = tau <= 1e-8
+        s = vol * np.sqrt(tau)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = np.where(expired, 0.0, (np.log(S / K) + r * tau) / s)
+
+        return S, expired, x, s
+
+
+def validation_report(market_data, simulation_params, contract_params, greek_table):
+    """
+    Compares the surfaces of the simulation engine computed with exact
+    Greeks (delta_finder & gamma_finder) and with the interpolated Greek
+    tables.
+
+    Parameters
+    ----------
+    market_data : dict
+        Dictionary of market data DataFrames keyed by ticker.
+    simulation_params : dict
+        Simulation parameters (see Main.py).
+    contract_params : dict
+        Contract parameters (see Main.py).
+    greek_table : GreekTable
+        Tables used for the approximate run.
+
+    Returns
+    -------
+    report : pd.DataFrame
+        One row per surface with the maximum and mean absolute difference
+        between the approximate and exact surfaces, the largest absolute
+        exact value, and the run times and speedup of the two paths.
+    """
+
+    ra = simulation_params["Risk Aversion Coeff."]
+
+    surfaces = {}
+    times = {}
+    for name, table in [("Exact", None), ("Approximate", greek_table)]:
+        start = time.perf_counter()
+        PnL_dataframe = hedging_simulation(market_data, simulation_params, contract_params, table)
+        times[name] = time.perf_counter() - start
+
+        # Surfaces as in Main.py
+
+        grouped = PnL_dataframe.groupby(["Maturity (days)", "Moneyness"])
+        mean_PnL = grouped["PnL"].mean()
+        std_PnL = grouped["PnL"].std()
+        surfaces[name] = pd.DataFrame({
+            "Mean PnL": mean_PnL,
+            "Std. Deviation of PnL": std_PnL,
+            "Volatility Premium": -mean_PnL + ra * std_PnL,
+            "Mean Gamma Error": grouped["Gamma Error"].mean()
+        })
+
+    errors = (surfaces["Approximate"] - surfaces["Exact"]).abs()
+
+    return pd.DataFrame({
+        "Surface": errors.columns,
+        "Max Abs. Error": errors.max().to_numpy(),
+        "Mean Abs. Error": errors.mean().to_numpy(),
+        "Max Abs. Value": surfaces["Exact"].abs().max().to_numpy(),
+        "Exact Time (s)": times["Exact"],
+        "Approximate Time (s)": times["Approximate"],
+        "Speedup": times["Exact"] / times["Approximate"]
+    })
@@ -0,0 +1,367 @@
+import asyncio
+import time
+import numpy as np
+import pandas as pd
+from blackscholespricer import BS_optionprice
+from blackscholespricer import delta_finder
+
+
+class LatencyHistogram:
+    """
+    Histogram of tick-processing latencies on log-spaced bins.
+
+    Attributes
+    ----------
+    edges : np.ndarray
+        Bin edges in seconds (1 microsecond to 1 second).
+    counts : np.ndarray
+        Number of recorded latencies per bin (under/overflow in the end bins).
+    """
+
+    def __init__(self, bins_per_decade=10):
+        """
+        Initialises the LatencyHistogram object.
+
+        Parameters
+        ----------
+        bins_per_decade : int
+            Number of bins per factor of ten in latency.
+        """
+
+        self.edges = np.logspace(-6, 0, 6 * bins_per_decade + 1)
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        """
+        Records a single latency (in seconds).
+        """
+
+        i = np.searchsorted(self.edges, seconds, side="right") - 1
+        self.counts[min(max(i, 0), len(self.counts) - 1)] += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q):
+        """
+        Approximate latency percentile (upper edge of the bin containing it).
+
+        Parameters
+        ----------
+        q : float
+            Percentile in [0, 100].
+
+        Returns
+        -------
+        float
+            Latency in seconds.
+        """
+
+        n = self.counts.sum()
+        if n == 0:
+            return np.nan
+        i = np.searchsorted(np.cumsum(self.counts), q / 100 * n)
+        return self.edges[min(i, len(self.counts) - 1) + 1]
+
+    def summary(self):
+        """
+        Summary of the recorded latencies in microseconds.
+
+        Returns
+        -------
+        dict
+            Number of ticks, mean, p50, p99 and max latency.
+        """
+
+        n = int(self.counts.sum())
+        return {
+            "Ticks": n,
+            "Mean (us)": 1e6 * self.total / n if n else np.nan,
+            "p50 (us)": 1e6 * self.percentile(50),
+            "p99 (us)": 1e6 * self.percentile(99),
+            "Max (us)": 1e6 * self.max
+        }
+
+
+class LiveHedgeBook:
+    """
+    Book of written European options, delta-hedged tick by tick.
+
+    Uses the same conventions as the batch path (delta_finder & hedgebook):
+    the hedge is set up when the position is opened, rebalanced on every
+    tick before expiry and not rebalanced on the expiry tick. Open positions
+    are held per ticker as arrays so a tick updates all of them at once.
+
+    Attributes
+    ----------
+    r : float
+        Risk-free interest rate.
+    vol : float
+        Volatility used for pricing and hedging.
+    option_type : str
+        Type of option ('call' or 'put').
+    positions : dict
+        Open positions per ticker (dict of arrays).
+    settled : list of dict
+        Records of positions settled at expiry.
+    latency : LatencyHistogram
+        Latencies of on_tick.
+    """
+
+    _fields = ["Position", "Strike", "Expiry", "Option Price", "Hedge Cost", "Delta"]
+
+    def __init__(self, r, vol, option_type):
+        """
+        Initialises the LiveHedgeBook object.
+
+        Parameters
+        ----------
+        r : float
+            Risk-free interest rate (annualised).
+        vol : float
+            Annualised volatility.
+        option_type : str
+            Type of option ('call' or 'put').
+        """
+
+        if option_type not in ["call", "put"]:
+            raise ValueError("Option type must be 'call' or 'put'.")
+
+        self.r = r
+        self.vol = vol
+        self.option_type = option_type
+        self.positions = {}
+        self.settled = []
+        self.latency = LatencyHistogram()
+        self._next_id = 0
+
+    def open_positions(self, ticker, date, S, K, expiry, T=None):
+        """
+        Writes options on ticker at price S and sets up the initial hedge.
+
+        Parameters
+        ----------
+        ticker : str
+            Asset ticker.
+        date : str or datetime-like
+            Date the options are written.
+        S : float
+            Current asset price.
+        K : float or array-like
+            Strike price(s).
+        expiry : str, datetime-like or array-like
+            Expiry date(s).
+        T : float or array-like, optional
+            Time to maturity (years) used to price the options. Defaults to
+            calendar days to expiry / 365.
+
+        Returns
+        -------
+        np.ndarray
+            Ids of the new positions.
+        """
+
+        date = np.datetime64(pd.Timestamp(date), "D")
+        expiry = np.atleast_1d(np.asarray(pd.to_datetime(expiry), dtype="datetime64[D]"))
+        K = np.atleast_1d(np.asarray(K, dtype=float))
+        K, expiry = np.broadcast_arrays(K, expiry)
+
+        tau = (expiry - date).astype(int) / 365
+        T = tau if T is None else np.broadcast_to(np.asarray(T, dtype=float), K.shape)
+
+        # Option Premium & Initial Hedge (Day 0)
+
+        option_price = np.array([BS_optionprice(S, k, self.r, t, self.vol, self.option_type) for k, t in zip(K, T)])
+        delta = delta_finder(S, K, self.r, tau, self.vol, self.option_type)
+
+        ids = np.arange(self._next_id, self._next_id + len(K))
+        self._next_id += len(K)
+
+        new = dict(zip(self._fields, [ids, K.copy(), expiry.copy(), option_price, delta * S, delta]))
+        book = self.positions.get(ticker)
+        self.positions[ticker] = new if book is None else {f: np.concatenate([book[f], new[f]]) for f in self._fields}
+
+        return ids
+
+    def on_tick(self, date, ticker, S):
+        """
+        Updates delta, cash and PnL of every open position on ticker.
+
+        Positions reaching expiry are settled without rebalancing, exactly as
+        in the batch path: PnL = option price - hedge cost - payoff + delta * S.
+
+        Parameters
+        ----------
+        date : str or datetime-like
+            Tick date.
+        ticker : str
+            Asset ticker.
+        S : float
+            Asset price.
+
+        Returns
+        -------
+        dict or None
+            Arrays of "Position", "Strike", "Delta", "Cash" and "PnL" for the
+            positions open before the tick, or None if there are none on ticker.
+        """
+
+        start = time.perf_counter()
+
+        book = self.positions.get(ticker)
+        if book is None or len(book["Position"]) == 0:
+            return None
+
+        date = np.datetime64(pd.Timestamp(date), "D")
+        tau = np.maximum((book["Expiry"] - date).astype(int), 0) / 365
+        expiring = np.isclose(tau, 0)
+
+        # 1. Rebalance Positions Before Expiry
+
+        live = ~expiring
+        new_delta = delta_finder(S, book["Strike"][live], self.r, tau[live], self.vol, self.option_type)
+        book["Hedge Cost"][live] += (new_delta - book["Delta"][live]) * S
+        book["Delta"][live] = new_delta
+
+        # 2. Cash & Settlement PnL (PnL if Settled at the Current Price)
+
+        cash = book["Option Price"] - book["Hedge Cost"]
+        if self.option_type == "call":
+            payoff = np.maximum(S - book["Strike"], 0)
+        else:
+            payoff = np.maximum(book["Strike"] - S, 0)
+        PnL = cash + book["Delta"] * S - payoff
+
+        state = {
+            "Position": book["Position"],
+            "Strike": book["Strike"],
+            "Delta": book["Delta"].copy(),
+            "Cash": cash,
+            "PnL": PnL
+        }
+
+        # 3. Settle Expiring Positions
+
+        if expiring.any():
+            for i in np.flatnonzero(expiring):
+                self.settled.append({
+                    "Ticker": ticker,
+                    "Position": book["Position"][i],
+                    "Settlement Date": pd.Timestamp(date),
+                    "Strike": book["Strike"][i],
+                    "Option Price": book["Option Price"][i],
+                    "PnL": PnL[i]
+                })
+            self.positions[ticker] = {f: book[f][live] for f in self._fields}
+
+        self.latency.record(time.perf_counter() - start)
+
+        return state
+
+
+async def replay_source(market_data, speed=None):
+    """
+    Replays the bundled market data as a stream of (date, ticker, price) ticks.
+
+    Parameters
+    ----------
+    market_data : dict
+        Dictionary of market data DataFrames keyed by ticker (see get_market_data).
+    speed : float, optional
+        Replay speed in trading days per second. None replays as fast as possible.
+
+    Yields
+    ------
+    tuple
+        (date, ticker, price) in ascending date order.
+    """
+
+    ticks = pd.concat(
+        [data[["Date", "Close/Last"]].assign(Ticker=ticker) for ticker, data in market_data.items()]
+    ).sort_values(["Date", "Ticker"])
+
+    for date, day in ticks.groupby("Date", sort=True):
+        for ticker, price in zip(day["Ticker"], day["Close/Last"]):
+            yield date, ticker, float(price)
+        await asyncio.sleep(0 if speed is None else 1 / speed)
+
+
+async def serve_replay(market_data, host="127.0.0.1", port=8765, speed=None):
+    """
+    Socket stand-in for a live feed: streams the replayed ticks to each
+    client as "YYYY-MM-DD,TICKER,PRICE" lines.
+
+    Parameters
+    ----------
+    market_data : dict
+        Dictionary of market data DataFrames keyed by ticker.
+    host : str
+        Host to bind.
+    port : int
+        Port to bind.
+    speed : float, optional
+        Replay speed in trading days per second.
+
+    Returns
+    -------
+    asyncio.Server
+        The running server.
+    """
+
+    async def stream(reader, writer):
+        try:
+            async for date, ticker, price in replay_source(market_data, speed):
+                writer.write(f"{date:%Y-%m-%d},{ticker},{price}\n".encode())
+                await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(stream, host, port)
+
+
+async def socket_source(host="127.0.0.1", port=8765):
+    """
+    Subscribes to a line-based price feed (see serve_replay).
+
+    Yields
+    ------
+    tuple
+        (date, ticker, price) for each line received.
+    """
+
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while line := await reader.readline():
+            date, ticker, price = line.decode().strip().split(",")
+            yield pd.Timestamp(date), ticker, float(price)
+    finally:
+        writer.close()
+
+
+async def run_hedger(book, source, on_tick=None):
+    """
+    Event loop of the live hedger: applies every tick of source to book.
+
+    Parameters
+    ----------
+    book : LiveHedgeBook
+        Book of hedged positions.
+    source : async iterable
+        Price source yielding (date, ticker, price), e.g. replay_source or socket_source.
+    on_tick : callable, optional
+        Called as on_tick(book, date, ticker, price, state) after each tick,
+        e.g. to write new positions.
+
+    Returns
+    -------
+    LiveHedgeBook
+        The updated book.
+    """
+
+    async for date, ticker, price in source:
+        state = book.on_tick(date, ticker, price)
+        if on_tick is not None:
+            on_tick(book, date, ticker, price, state)
+
+    return book
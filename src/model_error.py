@@ -10,7 +10,7 @@ import numpy as np
 import pandas as pd
 from blackscholespricer import gamma_finder    
 
-def get_gamma_error(data, K, r, vol, option_type):
+def get_gamma_error(data, K, r, vol, option_type, greek_table=None):
     """
     Compute gamma error over a rolling window of market data.
     
@@ -26,6 +26,9 @@ def get_gamma_error(data, K, r, vol, option_type):
         Volatility.
     option_type : str
         'call' or 'put'.
+    greek_table : GreekTable, optional
+        Interpolated Greek tables (see greek_tables). If given, gamma is
+        looked up in the tables instead of evaluated exactly.
     
     Returns
     -------
@@ -37,7 +40,10 @@ def get_gamma_error(data, K, r, vol, option_type):
     tau_days = (data["Date"].iloc[-1] - data["Date"]).dt.days.to_numpy()
     tau = tau_days / 365
 
-    gamma = gamma_finder(S, K, r, tau, vol, option_type)
+    if greek_table is not None:
+        gamma = greek_table.gamma(S, K, r, tau, vol, option_type)
+    else:
+        gamma = gamma_finder(S, K, r, tau, vol, option_type)
 
     delta_S = np.diff(S)
 
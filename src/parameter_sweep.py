@@ -0,0 +1,221 @@
+import numpy as np
+from scipy.stats import norm
+from scipy.special import ndtr
+
+
+def window_intermediates(ticker_data, maturity, money, rw):
+    """
+    Parameter-independent intermediates for every rolling window of one
+    asset and maturity (same windows as get_rolling_windows).
+
+    Parameters
+    ----------
+    ticker_data : pd.DataFrame
+        Market data for the asset ("Date" and "Close/Last" columns).
+    maturity : float
+        Time to maturity in years.
+    money : np.ndarray
+        Moneyness levels (S0 / K).
+    rw : int
+        Rolling window step in trading days.
+
+    Returns
+    -------
+    dict or None
+        Arrays (W = windows, M = moneyness levels, D = days per window):
+            - "S" (W x D): asset prices
+            - "K" (M x W): strikes
+            - "log(S/K) / sqrt(tau)" (M x W x D-1): scaled log-moneyness before expiry
+            - "sqrt(tau)" (W x D-1): square root of calendar time to expiry in years
+            - "payoff call" / "payoff put" (M x W): payoffs at expiry
+            - "Realised Volatility" (W): realised volatility of each window
+        None if the data is too short for a single window.
+    """
+
+    # 1. Windows as a (W x D) Index Matrix
+
+    ticker_data = ticker_data.sort_values("Date", ascending=True)
+    prices = ticker_data["Close/Last"].to_numpy(dtype=float)
+    days = ticker_data["Date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+
+    T_trading = int(maturity * 252)
+    starts = np.arange(0, len(prices) - T_trading + 1, rw)
+    if len(starts) == 0 or T_trading < 3:
+        return None
+
+    idx = starts[:, None] + np.arange(T_trading)
+    S = prices[idx]
+    tau = (days[idx][:, -1:] - days[idx]) / 365
+
+    # 2. Strikes, Log-Moneyness & Payoffs
+
+    K = S[:, 0][None, :] / money[:, None]
+    log_SK = np.log(S[None, :, :-1]) - np.log(K)[:, :, None]
+    sqrt_tau = np.sqrt(tau[:, :-1])
+    ST = S[:, -1][None, :]
+
+    # 3. Realised Volatility (see realised_volatility_calculation)
+
+    ri = np.diff(np.log(S), axis=1)
+    real_vol = ri.std(axis=1, ddof=1) * np.sqrt(252)
+
+    return {
+        "S": S,
+        "K": K,
+        "log(S/K) / sqrt(tau)": log_SK / sqrt_tau,
+        "sqrt(tau)": sqrt_tau,
+        "payoff call": np.maximum(ST - K, 0),
+        "payoff put": np.maximum(K - ST, 0),
+        "Realised Volatility": real_vol
+    }
+
+
+def bs_unit_price(money, r, T, vol, option_type):
+    """
+    Black-Scholes price per unit of initial asset price, broadcast over
+    moneyness, rate and volatility (see BS_optionprice).
+    """
+
+    d1 = (np.log(money) + (r + 0.5 * vol**2) * T) / (vol * np.sqrt(T))
+    d2 = d1 - vol * np.sqrt(T)
+
+    if option_type == "call":
+        return norm.cdf(d1) - np.exp(-r * T) * norm.cdf(d2) / money
+    else:  # Put
+        return np.exp(-r * T) * norm.cdf(-d2) / money - norm.cdf(-d1)
+
+
+def parameter_sweep(market_data, simulation_params, contract_params, vols=None, rates=None, max_elements=2_000_000):
+    """
+    Delta-hedging simulation of Main.py swept over volatility and risk-free
+    rate in a single run.
+
+    Windows, log(S/K), tau, payoffs and realised volatility do not depend on
+    the volatility or rate, so they are computed once per asset and maturity.
+    Volatility and rate are then added as leading broadcast axes of the delta,
+    hedge cost, gamma and pricing arrays.
+
+    Parameters
+    ----------
+    market_data : dict
+        Dictionary of market data DataFrames keyed by ticker.
+    simulation_params : dict
+        Simulation parameters (see Main.py).
+    contract_params : dict
+        Contract parameters (see Main.py).
+    vols : array-like, optional
+        Estimated volatilities to sweep. Defaults to simulation_params["Estimated Volatility"].
+    rates : array-like, optional
+        Risk-free interest rates to sweep. Defaults to simulation_params["Risk-Free Interest Rate"].
+    max_elements : int
+        Upper bound on the size of the (vol x rate x moneyness x windows x days)
+        arrays; windows are processed in chunks to respect it.
+
+    Returns
+    -------
+    results : dict
+        Coordinates "Estimated Volatility", "Risk-Free Interest Rate",
+        "Maturity (days)" and "Moneyness", and cubes of shape
+        (vol x rate x maturity x moneyness) for "Mean PnL",
+        "Std. Deviation of PnL", "Option Price", "Volatility Premium",
+        "Mean Volatility Mis-Pricing" and "Mean Gamma Error". Statistics pool
+        all assets and windows, as the groupbys in Main.py do.
+    """
+
+    # 1. Sweep Axes
+
+    vols = np.atleast_1d(simulation_params["Estimated Volatility"] if vols is None else vols).astype(float)
+    rates = np.atleast_1d(simulation_params["Risk-Free Interest Rate"] if rates is None else rates).astype(float)
+    maturities = np.asarray(contract_params["Time To Maturity (Years) Range"], dtype=float)
+    money = np.asarray(contract_params["Moneyness Range"], dtype=float)
+    option_type = contract_params["Option Type"]
+    rw = simulation_params["Rolling Window"]
+    ra = simulation_params["Risk Aversion Coeff."]
+
+    if np.any(vols <= 0):
+        raise ValueError("Volatility must be strictly positive.")
+    if option_type not in ["call", "put"]:
+        raise ValueError("Option type must be 'call' or 'put'.")
+
+    V, R, M = len(vols), len(rates), len(money)
+    v = vols[:, None, None, None, None]
+    r = rates[None, :, None, None, None]
+
+    shape = (V, R, len(maturities), M)
+    n = np.zeros(len(maturities))
+    sums = {name: np.zeros(shape) for name in ["PnL", "PnL^2", "Option Price", "Volatility Mispricing", "Gamma Error"]}
+
+    for ticker in contract_params["Asset"]:
+        for i, maturity in enumerate(maturities):
+
+            # 2. Parameter-Independent Intermediates (Computed Once)
+
+            w = window_intermediates(market_data[ticker], maturity, money, rw)
+            if w is None:
+                continue
+
+            W, D = w["S"].shape
+            n[i] += W
+            payoff = w["payoff " + option_type]
+
+            # Option Prices: Unit Price (vol x rate x moneyness) Scaled by S0
+
+            S0 = w["S"][:, 0]
+            unit_price = bs_unit_price(money[None, None, :], rates[None, :, None], maturity, vols[:, None, None], option_type)
+            option_price = unit_price[..., None] * S0
+            unit_price_real = bs_unit_price(money[None, :, None], rates[:, None, None], maturity, w["Realised Volatility"], option_type)
+            vol_mispricing = unit_price_real * S0 - option_price
+
+            sums["Option Price"][:, :, i] += option_price.sum(axis=-1)
+            sums["Volatility Mispricing"][:, :, i] += vol_mispricing.sum(axis=-1)
+
+            # 3. Vol / Rate Broadcast over Windows (Chunked)
+
+            chunk = max(1, int(max_elements // (V * R * M * D)))
+
+            for c in range(0, W, chunk):
+                sl = slice(c, c + chunk)
+                S = w["S"][sl]
+                sqrt_tau = w["sqrt(tau)"][sl]
+
+                # d1 = (log(S/K) + (r + vol^2 / 2) tau) / (vol sqrt(tau))
+
+                d1 = w["log(S/K) / sqrt(tau)"][:, sl] / v + (r / v + 0.5 * v) * sqrt_tau
+
+                # Delta (see delta_finder) & Hedge Cost (see hedgebook)
+
+                delta = ndtr(d1) if option_type == "call" else ndtr(d1) - 1.0
+                hedge_cost = delta[..., 0] * S[:, 0] + np.sum(np.diff(delta, axis=-1) * S[:, 1:-1], axis=-1)
+                money_held = delta[..., -1] * S[:, -1]
+
+                PnL = option_price[..., sl] - hedge_cost - payoff[:, sl] + money_held
+
+                # Gamma Error (see get_gamma_error)
+
+                pdf = np.exp(-0.5 * d1[..., 1:]**2) / np.sqrt(2 * np.pi)
+                gamma = pdf / (S[:, 1:-1] * v * sqrt_tau[:, 1:])
+                gamma_error = 0.5 * np.sum(gamma * np.diff(S[:, 1:], axis=-1)**2, axis=-1)
+
+                sums["PnL"][:, :, i] += PnL.sum(axis=-1)
+                sums["PnL^2"][:, :, i] += (PnL**2).sum(axis=-1)
+                sums["Gamma Error"][:, :, i] += gamma_error.sum(axis=-1)
+
+    # 4. Results Cubes
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        N = n[None, None, :, None]
+        mean_PnL = sums["PnL"] / N
+        std_PnL = np.sqrt(np.maximum(sums["PnL^2"] - sums["PnL"] * mean_PnL, 0.0) / (N - 1))
+
+        return {
+            "Estimated Volatility": vols,
+            "Risk-Free Interest Rate": rates,
+            "Maturity (days)": maturities * 365,
+            "Moneyness": money,
+            "Mean PnL": mean_PnL,
+            "Std. Deviation of PnL": std_PnL,
+            "Option Price": sums["Option Price"] / N,
+            "Volatility Premium": -mean_PnL + ra * std_PnL,
+            "Mean Volatility Mis-Pricing": sums["Volatility Mispricing"] / N,
+            "Mean Gamma Error": sums["Gamma Error"] / N
+        }
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+from get_rolling_windows import get_rolling_windows
+from option_contract import european_option
+from blackscholespricer import BS_optionprice
+from delta_computation import delta_computation
+from hedge_book import hedgebook
+from realised_vol_calculator import realised_volatility_calculation
+from model_error import get_gamma_error
+
+
+def hedging_simulation(market_data, simulation_params, contract_params, greek_table=None, window_cache=None, verbose=False):
+    """
+    Core simulation engine: discrete delta-hedging of the option writer over
+    every asset, maturity, moneyness and rolling window.
+
+    Parameters
+    ----------
+    market_data : dict
+        Dictionary of market data DataFrames keyed by ticker.
+    simulation_params : dict
+        Simulation parameters (see Main.py).
+    contract_params : dict
+        Contract parameters (see Main.py).
+    greek_table : GreekTable, optional
+        Interpolated Greek tables passed to delta_computation and
+        get_gamma_error (None: exact Greeks).
+    window_cache : dict, optional
+        Cache of rolling windows keyed by (ticker, maturity), shared between
+        calls so that windows are only extracted once per maturity.
+    verbose : bool
+        Print the ticker and maturity being simulated.
+
+    Returns
+    -------
+    PnL_dataframe : pd.DataFrame
+        One row per asset, maturity, moneyness and window with "Ticker",
+        "Maturity (days)", "Moneyness", "Start Date", "Option Price", "PnL",
+        "Realised Volatility", "Volatility Mispricing" and "Gamma Error".
+    """
+
+    if window_cache is None:
+        window_cache = {}
+
+    r = simulation_params["Risk-Free Interest Rate"]
+    vol = simulation_params["Estimated Volatility"]
+    option_type = contract_params["Option Type"]
+
+    PnL_records = []
+
+    for ticker in contract_params["Asset"]:
+        if verbose:
+            print(ticker)
+        for maturity in contract_params["Time To Maturity (Years) Range"]:
+            if verbose:
+                print(maturity)
+
+            # Rolling Windows (Cached per Maturity)
+
+            key = (ticker, maturity)
+            if key not in window_cache:
+                window_cache[key] = get_rolling_windows(market_data[ticker], np.float64(maturity), simulation_params["Rolling Window"])
+            windows = window_cache[key]
+
+            for money in contract_params["Moneyness Range"]:
+                for roll in windows:
+                    data = windows[roll]
+
+                    # Historical Asset Prices & Contract Strike Price
+
+                    S = data["Close/Last"]
+                    K = S.iloc[0] / money
+
+                    # Option Contract & Payoff
+
+                    contract = european_option(S.iloc[0], K, maturity, option_type)
+                    payoff = contract.payoff(S.iloc[-1])
+
+                    # Option Valuation w/ Black-Scholes
+
+                    option_price = BS_optionprice(S.iloc[0], K, r, maturity, vol, option_type)
+                    delta = delta_computation(data, K, r, vol, option_type, greek_table)
+
+                    # Hedging Costs
+
+                    hedge_cost, money_held = hedgebook(delta, S)
+
+                    # Diagnostic 1 - Volatility Mis-Pricing
+
+                    real_vol = realised_volatility_calculation(data)
+                    option_price_real = BS_optionprice(S.iloc[0], K, r, maturity, real_vol, option_type)
+
+                    PnL_records.append({
+                        "Ticker": ticker,
+                        "Maturity (days)": maturity * 365,
+                        "Moneyness": money,
+                        "Start Date": roll,
+                        "Option Price": option_price,
+                        "PnL": option_price - hedge_cost - payoff + money_held[-1],
+                        "Realised Volatility": real_vol,
+                        "Volatility Mispricing": option_price_real - option_price,
+                        "Gamma Error": get_gamma_error(data, K, r, vol, option_type, greek_table)  # Diagnostic 2
+                    })
+
+    columns = ["Ticker", "Maturity (days)", "Moneyness", "Start Date", "Option Price", "PnL",
+               "Realised Volatility", "Volatility Mispricing", "Gamma Error"]
+
+    return pd.DataFrame(PnL_records, columns=columns)
@@ -1,11 +1,44 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from scipy.interpolate import griddata
 
-def surface_plotting(dataframe, x_col, y_col, z_col, title, z_label, cmap='plasma'):
+def interpolate_surface(dataframe, x_col, y_col, z_col, X, Y):
+    """
+    Linearly interpolates scattered (x, y, z) data onto the points (X, Y).
+
+    Parameters:
+    - dataframe (pd.DataFrame): The scattered data
+    - x_col (str): Column name for the x-axis
+    - y_col (str): Column name for the y-axis
+    - z_col (str): Column name for the z-axis
+    - X (np.ndarray): x-coordinates of the points to interpolate onto
+    - Y (np.ndarray): y-coordinates of the points to interpolate onto (same shape as X)
+
+    Returns:
+    - Z (np.ndarray): Interpolated values (NaN outside the convex hull of the data)
+    """
+
+    # Axes Rescaled to [0, 1] so the Triangulation is not Skewed by Units
+    x = dataframe[x_col].to_numpy(dtype=float)
+    y = dataframe[y_col].to_numpy(dtype=float)
+    x_span = (x.min(), max(np.ptp(x), 1e-12))
+    y_span = (y.min(), max(np.ptp(y), 1e-12))
+
+    points = np.column_stack(((x - x_span[0]) / x_span[1], (y - y_span[0]) / y_span[1]))
+    targets = ((np.asarray(X) - x_span[0]) / x_span[1], (np.asarray(Y) - y_span[0]) / y_span[1])
+
+    return griddata(points, dataframe[z_col].to_numpy(dtype=float), targets, method='linear')
+
+
+def surface_plotting(dataframe, x_col, y_col, z_col, title, z_label, cmap='plasma', scattered=False, grid_points=50):
     """
     Plots a 3D surface given a DataFrame with x, y, and z values.
 
+    Data on a full rectangular grid is plotted directly. Scattered data (e.g.
+    from an adaptive sweep) is interpolated onto a regular grid first if
+    scattered is True.
+
     Parameters:
     - dataframe (pd.DataFrame): The data to plot
     - x_col (str): Column name for the x-axis
@@ -14,14 +47,23 @@ def surface_plotting(dataframe, x_col, y_col, z_col, title, z_label, cmap='plasm
     - title (str): Title of the plot
     - z_label (str): Label for the z-axis
     - cmap (str): Matplotlib colormap name (default: 'plasma')
+    - scattered (bool): Whether the data is scattered rather than a full grid (default: False)
+    - grid_points (int): Points per axis used when interpolating scattered data (default: 50)
     """
 
     # Data Manipulation
-    pivot_table = dataframe.pivot(index=y_col, columns=x_col, values=z_col)
-    X = pivot_table.columns.values
-    Y = pivot_table.index.values
-    X_grid, Y_grid = np.meshgrid(X, Y)
-    Z = pivot_table.values
+    if scattered:
+        # Scattered Data: Interpolate onto Regular Grid
+        X = np.linspace(dataframe[x_col].min(), dataframe[x_col].max(), grid_points)
+        Y = np.linspace(dataframe[y_col].min(), dataframe[y_col].max(), grid_points)
+        X_grid, Y_grid = np.meshgrid(X, Y)
+        Z = interpolate_surface(dataframe, x_col, y_col, z_col, X_grid, Y_grid)
+    else:
+        pivot_table = dataframe.pivot(index=y_col, columns=x_col, values=z_col)
+        X = pivot_table.columns.values
+        Y = pivot_table.index.values
+        X_grid, Y_grid = np.meshgrid(X, Y)
+        Z = pivot_table.values
 
     # Plotting
     fig = plt.figure(figsize=(20, 12))